@@ -1,12 +1,27 @@
 """Functions for interacting with the Alexa API (shopping list)."""
 
+import copy
+import functools
 import json
 import logging
+import os
+import threading
+import time
 import requests
-from http.cookies import SimpleCookie
-from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List, Dict, Any
 
+# orjson decodes JSON ~3-5x faster than the stdlib and matters on the
+# non-cached path (cookie file + full list responses). Fall back to the
+# stdlib when it isn't installed.
+try:
+    import orjson
+    def _json_loads(data): return orjson.loads(data)
+except ImportError:
+    orjson = None
+    def _json_loads(data): return json.loads(data)
+
 # Import the local config module itself
 from . import config as api_config
 
@@ -23,97 +38,176 @@ DEFAULT_HEADERS = {
     "Upgrade-Insecure-Requests": "1"
 }
 
+# Endpoint URLs assembled once at import instead of per call
+_URL_GET_ITEMS = f"{api_config.AMAZON_URL}/alexashoppinglists/api/getlistitems"
+# Use the correct add endpoint from documentation
+_URL_ADD_ITEM = (f"{api_config.AMAZON_URL}/alexashoppinglists/api/addlistitem/"
+                 "YW16bjEuYWNjb3VudC5BSERXNEkyVE00U1I0UVQ2VUpINzNWUVpaQU5BLVNIT1BQSU5HX0lURU0=")
+_URL_DELETE_ITEM = f"{api_config.AMAZON_URL}/alexashoppinglists/api/deletelistitem"
+_URL_UPDATE_ITEM = f"{api_config.AMAZON_URL}/alexashoppinglists/api/updatelistitem"
+
+# --- Shared HTTP Session ---
+
+# A single module-level session so every request reuses the same pooled
+# keep-alive connections to Amazon instead of paying DNS + TCP + TLS
+# setup on each call. Pool size leaves headroom for concurrent requests.
+_SESSION = requests.Session()
+_SESSION.headers.update(DEFAULT_HEADERS)
+_SESSION.trust_env = False  # Skip per-request proxy environment lookups
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# (connect, read) timeout so a stalled Amazon endpoint can't hang a call forever
+_REQUEST_TIMEOUT = (3.05, 10)
+
 # --- Cookie Handling ---
 
 # Hardcoded path for cookie loading *within the container*
 # Adjusted for JSON format
 CONTAINER_COOKIE_PATH = "/app/data/cookies.json"
 
+# --- List Response Cache ---
+
+# Short-TTL cache for the shopping list response. Every endpoint hits
+# get_shopping_list_items(), so without this each tool call pays a full
+# HTTPS round-trip to Amazon even when nothing changed. Mutating calls
+# invalidate the cache explicitly, so the TTL only bounds staleness from
+# changes made outside this server (e.g. via the Alexa app).
+_CACHE_TTL = 5.0  # seconds
+# 'etag'/'last_modified' hold the validators from the last 200 response so
+# an expired cache entry can be revalidated with a conditional GET (a 304
+# saves the response body transfer and the JSON decode).
+# 'gen' is a generation counter bumped whenever the cached body changes or
+# is invalidated; derived caches key off it to know when to recompute.
+_LIST_CACHE: Dict[str, Any] = {"data": None, "ts": 0.0, "etag": None, "last_modified": None, "gen": 0}
+# FastAPI/FastMCP may serve requests concurrently, so guard the cache.
+_CACHE_LOCK = threading.Lock()
+
+def _invalidate_list_cache() -> None:
+    """Drops the cached shopping list (called after any successful mutation)."""
+    with _CACHE_LOCK:
+        _LIST_CACHE["data"] = None
+        _LIST_CACHE["gen"] += 1
+
+def list_cache_generation() -> int:
+    """Returns the current list-cache generation (changes on every refresh/invalidate)."""
+    with _CACHE_LOCK:
+        return _LIST_CACHE["gen"]
+
 def load_cookies_from_json_file(cookie_file_path: str) -> Optional[List[Dict[str, Any]]]:
     """Loads cookies from a JSON file (expected list of dicts)."""
     try:
-        with open(cookie_file_path, 'r', encoding='utf-8') as f:
-            cookies_list = json.load(f) # Load list of cookie dicts
+        with open(cookie_file_path, 'rb') as f:
+            cookies_list = _json_loads(f.read()) # Load list of cookie dicts
 
         if not isinstance(cookies_list, list):
-            logger.error(f"Expected a list in {cookie_file_path}, got {type(cookies_list)}.")
+            logger.error("Expected a list in %s, got %s.", cookie_file_path, type(cookies_list))
             return None
 
         # Return the full list of dictionaries for detailed processing
-        logger.debug(f"Successfully loaded {len(cookies_list)} cookie dicts from JSON: {cookie_file_path}")
+        logger.debug("Successfully loaded %d cookie dicts from JSON: %s", len(cookies_list), cookie_file_path)
         return cookies_list
 
     except FileNotFoundError:
-        logger.error(f"Cookie file not found: {cookie_file_path}")
+        logger.error("Cookie file not found: %s", cookie_file_path)
         return None
-    except json.JSONDecodeError as json_err:
-        logger.error(f"Failed to decode JSON from {cookie_file_path}: {json_err}")
+    except ValueError as json_err:  # Covers both json and orjson decode errors
+        logger.error("Failed to decode JSON from %s: %s", cookie_file_path, json_err)
         return None
     except Exception as err:
-        logger.error(f"Failed to load or parse cookies from JSON file {cookie_file_path}: {err}", exc_info=True)
+        logger.error("Failed to load or parse cookies from JSON file %s: %s", cookie_file_path, err, exc_info=True)
+        return None
+
+# The jar is built at most once per version of the cookie file: the mtime
+# argument only serves as the cache key, so after a new login (new mtime)
+# the stale entries age out of the small LRU. A failed parse is also
+# cached, which is fine — the file stays bad until it is rewritten, and a
+# rewrite changes the mtime.
+@functools.lru_cache(maxsize=4)
+def _build_cookie_jar(path: str, mtime: float) -> Optional[requests.cookies.RequestsCookieJar]:
+    """Builds a RequestsCookieJar from the JSON cookie file (cached per mtime)."""
+    cookie_list_of_dicts = load_cookies_from_json_file(path)
+    if not cookie_list_of_dicts:
         return None
 
+    jar = requests.cookies.RequestsCookieJar()
+    for cookie_dict in cookie_list_of_dicts:
+        name = cookie_dict.get('name')
+        value = cookie_dict.get('value')
+
+        if name and value:
+            jar.set(
+                name=name,
+                value=value,
+                domain=cookie_dict.get('domain'),
+                path=cookie_dict.get('path')
+                # requests automatically handles secure/expires/httpOnly for its context
+                # We mainly need name, value, domain, path for session management
+            )
+        else:
+            logger.warning("Skipping cookie dict with missing name/value: %s", cookie_dict)
+    return jar
+
+def _refresh_session_cookies() -> bool:
+    """Installs cookies from the container path onto the shared session.
+
+    Rebuilds the jar only when the file's mtime changes; the steady-state
+    per-request cost is one os.stat plus an LRU hit. Returns False if no
+    usable cookies are available.
+    """
+    try:
+        mtime = os.stat(CONTAINER_COOKIE_PATH).st_mtime
+    except OSError:
+        logger.error("Cookie file not found or unreadable: %s", CONTAINER_COOKIE_PATH)
+        return False
+
+    jar = _build_cookie_jar(CONTAINER_COOKIE_PATH, mtime)
+    if jar is None:
+        return False
+
+    if _SESSION.cookies is not jar:
+        _SESSION.cookies = jar
+        logger.debug("Installed %d cookies on shared session (mtime=%s).", len(jar), mtime)
+    return True
+
 # --- API Request Function ---
 def make_authenticated_request(
     url: str,
     # cookie_file_path: str, # No longer needed as parameter
     method: str = 'GET',
-    payload: Optional[Dict[str, Any]] = None
+    payload: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None
 ) -> Optional[requests.Response]:
     """Makes an authenticated request using cookies from the fixed container path."""
     try:
-        session = requests.Session()
-        session.headers.update(DEFAULT_HEADERS)
-        # Always load from the container path
-        cookie_list_of_dicts = load_cookies_from_json_file(CONTAINER_COOKIE_PATH)
-
-        if not cookie_list_of_dicts:
-            logger.error(f"No cookies loaded from {CONTAINER_COOKIE_PATH} for authenticated request.")
+        # Always load from the container path (cached until the file changes)
+        if not _refresh_session_cookies():
+            logger.error("No cookies loaded from %s for authenticated request.", CONTAINER_COOKIE_PATH)
             return None
 
-        # Set cookies individually using requests' set method
-        for cookie_dict in cookie_list_of_dicts:
-            name = cookie_dict.get('name')
-            value = cookie_dict.get('value')
-            domain = cookie_dict.get('domain')
-            path = cookie_dict.get('path')
-
-            if name and value:
-                logger.debug(f"Setting cookie: name={name}, domain={domain}, path={path}")
-                session.cookies.set(
-                    name=name,
-                    value=value,
-                    domain=domain,
-                    path=path
-                    # requests automatically handles secure/expires/httpOnly for its context
-                    # We mainly need name, value, domain, path for session management
-                )
-            else:
-                logger.warning(f"Skipping cookie dict with missing name/value: {cookie_dict}")
-
-        logger.debug(f"Making {method} request to {url}")
-        if method.upper() == 'GET':
-            response = session.get(url)
-        elif method.upper() == 'PUT':
-            logger.debug(f"PUT payload: {payload}")
-            response = session.put(url, json=payload)
-        elif method.upper() == 'POST':
-            logger.debug(f"POST payload: {payload}")
-            response = session.post(url, json=payload)
-        elif method.upper() == 'DELETE':
-            logger.debug(f"DELETE request to {url}")
-            # Allow DELETE with an optional payload (needed for Alexa API)
-            response = session.delete(url, json=payload)
-        else:
-            logger.error(f"Unsupported method specified: {method}")
+        method = method.upper()
+        if method not in ('GET', 'PUT', 'POST', 'DELETE'):
+            logger.error("Unsupported method specified: %s", method)
             return None
 
+        logger.debug("Making %s request to %s", method, url)
+        if payload is not None:
+            logger.debug("%s payload: %s", method, payload)
+        # DELETE may carry an optional payload (needed for Alexa API)
+        response = _SESSION.request(method, url, json=payload, headers=headers,
+                                    timeout=_REQUEST_TIMEOUT)
+
         response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-        logger.debug(f"Request successful ({response.status_code})")
+        logger.debug("Request successful (%s)", response.status_code)
         return response
 
     except requests.exceptions.RequestException as err:
-        logger.error(f"HTTP request failed: {err}")
+        logger.error("HTTP request failed: %s", err)
         return None
     except Exception as e:
         logger.exception(f"Unexpected error during authenticated request: {e}")
@@ -127,26 +221,95 @@ def extract_list_items(response_data: Dict[str, Any]) -> Optional[List[Dict[str,
         if isinstance(response_data[key], dict) and 'listItems' in response_data[key]:
             return response_data[key]['listItems']
     logger.warning("Could not find 'listItems' in response data structure.")
-    logger.debug(f"Full response keys: {list(response_data.keys())}")
+    logger.debug("Full response keys: %s", list(response_data.keys()))
     return None
 
-def filter_incomplete_items(list_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Filters a list of items to include only those not marked completed."""
-    return [item for item in list_items if not item.get('completed', False)]
+def partition_items(list_items: List[Dict[str, Any]]) -> "tuple[List[Dict[str, Any]], List[Dict[str, Any]]]":
+    """Splits items into (incomplete, completed) lists in a single pass.
+
+    Cheaper than running two comprehensions over the same list; the
+    append methods are bound outside the loop.
+    """
+    incomplete: List[Dict[str, Any]] = []
+    completed: List[Dict[str, Any]] = []
+    add_incomplete = incomplete.append
+    add_completed = completed.append
+    for item in list_items:
+        (add_completed if item.get('completed', False) else add_incomplete)(item)
+    return incomplete, completed
+
+# Memoized partition of the cached list, keyed on the cache generation so
+# back-to-back read calls skip re-filtering entirely.
+_PARTITION_CACHE: Dict[str, Any] = {"gen": -1, "parts": None}
+
+def get_partitioned_items(force_refresh: bool = False) -> Optional["tuple[List[Dict[str, Any]], List[Dict[str, Any]]]"]:
+    """Returns (incomplete, completed) for the current list, or None on failure.
+
+    The split is computed at most once per list-cache generation; repeat
+    reads within the TTL return the memoized pair directly.
+    """
+    items = get_shopping_list_items(force_refresh=force_refresh)
+    if items is None:
+        return None
+    with _CACHE_LOCK:
+        gen = _LIST_CACHE["gen"]
+        if _PARTITION_CACHE["gen"] == gen and _PARTITION_CACHE["parts"] is not None:
+            return _PARTITION_CACHE["parts"]
+    parts = partition_items(items)
+    with _CACHE_LOCK:
+        _PARTITION_CACHE["gen"] = gen
+        _PARTITION_CACHE["parts"] = parts
+    return parts
+
+def get_shopping_list_items(force_refresh: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """Gets all items from the Alexa shopping list.
+
+    Results are cached for a few seconds to avoid a fresh HTTPS round-trip
+    on every call; pass force_refresh=True to bypass the cache.
+    """
+    conditional_headers = None
+    with _CACHE_LOCK:
+        cached = _LIST_CACHE["data"]
+        if not force_refresh and cached is not None \
+                and (time.monotonic() - _LIST_CACHE["ts"]) < _CACHE_TTL:
+            logger.debug("Returning cached shopping list data.")
+            # Deep copy so callers mutating items can't corrupt the cache
+            return copy.deepcopy(cached)
+        # Cache expired but body still held: revalidate instead of redownloading
+        if cached is not None:
+            conditional_headers = {}
+            if _LIST_CACHE["etag"]:
+                conditional_headers['If-None-Match'] = _LIST_CACHE["etag"]
+            if _LIST_CACHE["last_modified"]:
+                conditional_headers['If-Modified-Since'] = _LIST_CACHE["last_modified"]
+            conditional_headers = conditional_headers or None
 
-def get_shopping_list_items() -> Optional[List[Dict[str, Any]]]:
-    """Gets all items from the Alexa shopping list."""
-    list_items_url = f"{api_config.AMAZON_URL}/alexashoppinglists/api/getlistitems"
     # Pass the config but the function now ignores the cookie_path within it
-    response = make_authenticated_request(list_items_url, method='GET')
+    response = make_authenticated_request(_URL_GET_ITEMS, method='GET', headers=conditional_headers)
     if response:
+        if response.status_code == 304:
+            # List unchanged on the server; refresh the TTL and skip the decode
+            logger.debug("Shopping list not modified (304); serving revalidated cache.")
+            with _CACHE_LOCK:
+                _LIST_CACHE["ts"] = time.monotonic()
+                return copy.deepcopy(_LIST_CACHE["data"])
         try:
-            response_data = response.json()
+            # Parse the raw bytes directly; avoids requests' charset detection
+            # and uses orjson when available
+            response_data = _json_loads(response.content)
             logger.debug("Successfully retrieved shopping list data.")
-            return extract_list_items(response_data)
-        except requests.exceptions.JSONDecodeError as e:
-            logger.error(f"Failed to decode JSON response from shopping list API: {e}")
-            logger.debug(f"Response text: {response.text[:500]}") # Log first 500 chars
+            items = extract_list_items(response_data)
+            if items is not None:
+                with _CACHE_LOCK:
+                    _LIST_CACHE["data"] = copy.deepcopy(items)
+                    _LIST_CACHE["ts"] = time.monotonic()
+                    _LIST_CACHE["etag"] = response.headers.get('ETag')
+                    _LIST_CACHE["last_modified"] = response.headers.get('Last-Modified')
+                    _LIST_CACHE["gen"] += 1
+            return items
+        except ValueError as e:  # Covers both json and orjson decode errors
+            logger.error("Failed to decode JSON response from shopping list API: %s", e)
+            logger.debug("Response text: %s", response.text[:500]) # Log first 500 chars
             return None
     else:
         logger.error("Failed to retrieve shopping list data.")
@@ -154,31 +317,29 @@ def get_shopping_list_items() -> Optional[List[Dict[str, Any]]]:
 
 def add_shopping_list_item(item_value: str) -> bool:
     """Adds a new item to the Alexa shopping list."""
-    logger.info(f"Adding item to shopping list: {item_value}")
-    # Use the correct endpoint from documentation
-    add_item_path = "/alexashoppinglists/api/addlistitem/YW16bjEuYWNjb3VudC5BSERXNEkyVE00U1I0UVQ2VUpINzNWUVpaQU5BLVNIT1BQSU5HX0lURU0="
-    url = f"{api_config.AMAZON_URL}{add_item_path}"
+    logger.info("Adding item to shopping list: %s", item_value)
     payload = {
         "value": item_value,
         "type": "TASK" # Assuming 'TASK' type, common for shopping/todo lists
     }
 
     response = make_authenticated_request(
-        url,
+        _URL_ADD_ITEM,
         # config.cookie_path, # Removed
         method='POST', # Assuming POST for creation
         payload=payload
     )
 
     if response and response.status_code == 200: # Assuming 200 OK for success
-        logger.info(f"Successfully added item: {item_value}")
+        logger.info("Successfully added item: %s", item_value)
+        _invalidate_list_cache()
         return True
     else:
         status = response.status_code if response else 'No Response'
-        logger.error(f"Failed to add item: {item_value} (Status: {status})")
+        logger.error("Failed to add item: %s (Status: %s)", item_value, status)
         # Log response text for debugging if available and failed
         if response is not None:
-             logger.debug(f"Add item response text: {response.text[:500]}")
+             logger.debug("Add item response text: %s", response.text[:500])
         return False
 
 def mark_item_as_completed(list_item: Dict[str, Any]) -> bool:
@@ -191,17 +352,13 @@ def delete_shopping_list_item(list_item: Dict[str, Any]) -> bool:
     item_id = list_item.get('id')
 
     if not item_id:
-        logger.error(f"Cannot delete item '{item_value}' without an ID.")
+        logger.error("Cannot delete item '%s' without an ID.", item_value)
         return False
 
-    logger.info(f"Deleting item: {item_value} (ID: {item_id})")
-    # Use the correct base endpoint from documentation
-    delete_item_path = "/alexashoppinglists/api/deletelistitem"
-    url = f"{api_config.AMAZON_URL}{delete_item_path}"
-
+    logger.info("Deleting item: %s (ID: %s)", item_value, item_id)
     # Send the item dict (containing ID) as payload
     response = make_authenticated_request(
-        url,
+        _URL_DELETE_ITEM,
         # config.cookie_path, # Removed
         method='DELETE',
         payload=list_item # Send the whole item dict
@@ -209,14 +366,15 @@ def delete_shopping_list_item(list_item: Dict[str, Any]) -> bool:
 
     # Check for successful deletion (often 200 OK or 204 No Content)
     if response and (response.status_code == 200 or response.status_code == 204):
-        logger.info(f"Successfully deleted item: {item_value}")
+        logger.info("Successfully deleted item: %s", item_value)
+        _invalidate_list_cache()
         return True
     else:
         status = response.status_code if response else 'No Response'
-        logger.error(f"Failed to delete item: {item_value} (Status: {status})")
+        logger.error("Failed to delete item: %s (Status: %s)", item_value, status)
         # Log response text for debugging if available and failed
         if response is not None:
-            logger.debug(f"Delete item response text: {response.text[:500]}")
+            logger.debug("Delete item response text: %s", response.text[:500])
         return False
 
 def unmark_item_as_completed(list_item: Dict[str, Any]) -> bool:
@@ -229,24 +387,24 @@ def _update_item_completion_status(list_item: Dict[str, Any], completed_status:
     action = "Marking" if completed_status else "Unmarking"
     action_past = "marked" if completed_status else "unmarked"
 
-    logger.info(f"{action} item as completed: {item_value}")
-    url = f"{api_config.AMAZON_URL}/alexashoppinglists/api/updatelistitem"
+    logger.info("%s item as completed: %s", action, item_value)
     list_item_copy = list_item.copy()
     list_item_copy['completed'] = completed_status
 
     response = make_authenticated_request(
-        url,
+        _URL_UPDATE_ITEM,
         # config.cookie_path, # Removed
         method='PUT',
         payload=list_item_copy
     )
 
     if response and response.status_code == 200:
-        logger.info(f"Successfully {action_past} item as completed: {item_value}")
+        logger.info("Successfully %s item as completed: %s", action_past, item_value)
+        _invalidate_list_cache()
         return True
     else:
         status = response.status_code if response else 'No Response'
-        logger.error(f"Failed to {action.lower()} item as completed: {item_value} (Status: {status})")
+        logger.error("Failed to %s item as completed: %s (Status: %s)", action.lower(), item_value, status)
         if response is not None:
-            logger.debug(f"{action} item response text: {response.text[:500]}")
+            logger.debug("%s item response text: %s", action, response.text[:500])
         return False
@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
 import json # Added json for saving cookies
 
@@ -13,6 +14,7 @@ if project_root not in sys.path:
 # --- End Path Modification ---
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool  # Keep blocking Alexa calls off the event loop
 from pydantic import BaseModel, Field  # For request body validation
 
 # --- Scheduler Imports ---
@@ -31,8 +33,9 @@ try:
         delete_shopping_list_item,
         mark_item_as_completed,
         unmark_item_as_completed,
-        filter_incomplete_items,
-        # No filter_completed_items, we'll do it inline
+        partition_items,
+        get_partitioned_items,
+        list_cache_generation,
     )
 except ImportError as e:
     print(f"FATAL ERROR: Could not import alexa_shopping_list modules: {e}", file=sys.stderr)
@@ -41,12 +44,9 @@ except ImportError as e:
 
 # --- Globals & Setup ---
 
-# Configure basic logging
+# Configure logging based on local config (basicConfig is a no-op once the
+# root logger has handlers, so only call it once with the intended level)
 # Note: Uvicorn will likely handle more advanced logging config when run
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-# Configure logging based on local config
 logging.basicConfig(level=api_config.LOG_LEVEL_INT, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -57,6 +57,11 @@ if api_config.LOG_LEVEL_INT > logging.DEBUG:
     logging.getLogger("webdriver_manager").setLevel(logging.WARNING) # Likely not needed here
     logger.debug("Suppressed noisy library logs.")
 
+# Shared pool for fanning out independent per-item Alexa calls (deletes
+# are idempotent by ID, so there is no ordering requirement). Sized to
+# stay within the shared session's connection pool.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
 # --- Scheduler Setup ---
 scheduler = AsyncIOScheduler()
 
@@ -72,7 +77,8 @@ async def perform_keep_alive():
 
     try:
         # Call the function that gets all items, which uses make_authenticated_request
-        items = get_shopping_list_items()
+        # Bypass the list cache: the point of keep-alive is to hit Amazon
+        items = await run_in_threadpool(get_shopping_list_items, force_refresh=True)
         if items is not None:
             logger.info(f"Keep-alive successful: Fetched {len(items)} items.")
         else:
@@ -103,19 +109,51 @@ app = FastAPI(
 )
 
 # --- Helper Function ---
-def find_item_by_name(items: List[Dict[str, Any]], name: str) -> Dict[str, Any] | None:
-    """Finds the first item in a list matching the name (case-insensitive)."""
-    if items is None:
-        return None
-    for item in items:
-        if item.get("value", "").lower() == name.lower():
-            return item
-    return None
+def build_item_index(
+    items: Optional[List[Dict[str, Any]]],
+    completed: Optional[bool] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Builds a dict keyed on normalized item value for O(1) name lookups.
+
+    Normalization (strip + lower) happens once per item here instead of
+    once per comparison in a linear scan. When 'completed' is given, only
+    items with that completion state are indexed, fusing the filter and
+    search passes (and their intermediate list) into a single traversal.
+    The first item wins for duplicate names, matching the previous
+    first-match behaviour.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    if items:
+        for item in items:
+            if completed is not None and bool(item.get("completed", False)) != completed:
+                continue
+            index.setdefault(item.get("value", "").strip().lower(), item)
+    return index
+
+# Negative-lookup cache: maps (scope, normalized name) -> the list-cache
+# generation at which the name was confirmed absent. Repeated requests for
+# a name that isn't on the list (typo, already deleted) short-circuit to a
+# 404 without refetching or re-indexing. Entries expire automatically when
+# the generation bumps (any mutation or list refresh).
+_NEG_CACHE: Dict[Any, int] = {}
+
+def _is_known_absent(scope: str, needle: str) -> bool:
+    """True if 'needle' was confirmed absent at the current list generation."""
+    return _NEG_CACHE.get((scope, needle)) == list_cache_generation()
+
+def _remember_absent(scope: str, needle: str) -> None:
+    """Records that 'needle' is absent for the current list generation."""
+    if len(_NEG_CACHE) > 256:  # Bound growth from pathological inputs
+        _NEG_CACHE.clear()
+    _NEG_CACHE[(scope, needle)] = list_cache_generation()
 
 # --- Pydantic Models (for Request Bodies) ---
 class ItemNameModel(BaseModel):
     item_name: str = Field(..., description="The name of the shopping list item.")
 
+class ItemNamesModel(BaseModel):
+    item_names: List[str] = Field(..., description="The names of the shopping list items.")
+
 # Define a Pydantic model for the expected cookie structure (adjust if needed)
 class CookieModel(BaseModel):
     name: str
@@ -139,7 +177,7 @@ async def read_root():
 async def get_all_list_items():
     """Retrieves all items (completed and incomplete) from the shopping list."""
     logger.info("Endpoint GET /items/all called.")
-    items = get_shopping_list_items()
+    items = await run_in_threadpool(get_shopping_list_items)
     if items is None:
         logger.error("Failed to retrieve items from Alexa API.")
         raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
@@ -149,23 +187,22 @@ async def get_all_list_items():
 async def get_incomplete_list_items():
     """Retrieves only the incomplete items from the shopping list."""
     logger.info("Endpoint GET /items/incomplete called.")
-    all_items = get_shopping_list_items() # No longer needs config passed
-    if all_items is None:
+    parts = await run_in_threadpool(get_partitioned_items) # No longer needs config passed
+    if parts is None:
         logger.error("Failed to retrieve items from Alexa API.")
         raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
-    incomplete_items = filter_incomplete_items(all_items)
+    incomplete_items, _ = parts
     return incomplete_items
 
 @app.get("/items/completed", tags=["Items"], response_model=List[Dict[str, Any]])
 async def get_completed_list_items():
     """Retrieves only the completed items from the shopping list."""
     logger.info("Endpoint GET /items/completed called.")
-    all_items = get_shopping_list_items() # No longer needs config passed
-    if all_items is None:
+    parts = await run_in_threadpool(get_partitioned_items) # No longer needs config passed
+    if parts is None:
         logger.error("Failed to retrieve items from Alexa API.")
         raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
-    # Filter completed items directly
-    completed_items = [item for item in all_items if item.get('completed', False)]
+    _, completed_items = parts
     return completed_items
 
 @app.post("/items", tags=["Items"], status_code=201)  # 201 Created
@@ -173,7 +210,7 @@ async def add_new_item(item_data: ItemNameModel):
     """Adds a new item to the shopping list."""
     item_name = item_data.item_name
     logger.info(f"Endpoint POST /items called to add: '{item_name}'")
-    success = add_shopping_list_item(item_name) # No longer needs config passed
+    success = await run_in_threadpool(add_shopping_list_item, item_name) # No longer needs config passed
     if not success:
         logger.error(f"Failed to add item '{item_name}' via Alexa API.")
         raise HTTPException(status_code=500, detail=f"Failed to add item '{item_name}'.")
@@ -184,14 +221,24 @@ async def remove_item(item_data: ItemNameModel):
     """Deletes an item from the shopping list by name (case-insensitive)."""
     item_name = item_data.item_name
     logger.info(f"Endpoint DELETE /items called for: '{item_name}'")
-    all_items = get_shopping_list_items() # No longer needs config passed
-    item_to_delete = find_item_by_name(all_items or [], item_name)
+    needle = item_name.strip().lower()  # Normalize the requested name once
+    if _is_known_absent("any", needle):
+        logger.debug(f"Item '{item_name}' known absent at current generation; skipping fetch.")
+        raise HTTPException(status_code=404, detail=f"Item '{item_name}' not found.")
+    all_items = await run_in_threadpool(get_shopping_list_items) # No longer needs config passed
+    if all_items is None:
+        # Don't record absence off a failed fetch: failed fetches never bump
+        # the generation, so a cached 404 would outlive the outage
+        logger.error("Failed to retrieve items from Alexa API.")
+        raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
+    item_to_delete = build_item_index(all_items).get(needle)
 
     if not item_to_delete:
         logger.warning(f"Item '{item_name}' not found for deletion.")
+        _remember_absent("any", needle)
         raise HTTPException(status_code=404, detail=f"Item '{item_name}' not found.")
 
-    success = delete_shopping_list_item(item_to_delete) # No longer needs config passed
+    success = await run_in_threadpool(delete_shopping_list_item, item_to_delete) # No longer needs config passed
     if not success:
         logger.error(f"Failed to delete item '{item_name}' via Alexa API.")
         raise HTTPException(status_code=500, detail=f"Failed to delete item '{item_name}'.")
@@ -202,15 +249,23 @@ async def mark_item_complete(item_data: ItemNameModel):
     """Marks an item as completed by name (case-insensitive)."""
     item_name = item_data.item_name
     logger.info(f"Endpoint PUT /items/mark_completed called for: '{item_name}'")
-    all_items = get_shopping_list_items() # No longer needs config passed
-    # Find an *incomplete* item matching the name
-    item_to_mark = find_item_by_name(filter_incomplete_items(all_items or []), item_name)
+    needle = item_name.strip().lower()  # Normalize the requested name once
+    if _is_known_absent("incomplete", needle):
+        logger.debug(f"Incomplete item '{item_name}' known absent at current generation; skipping fetch.")
+        raise HTTPException(status_code=404, detail=f"Incomplete item '{item_name}' not found.")
+    all_items = await run_in_threadpool(get_shopping_list_items) # No longer needs config passed
+    if all_items is None:
+        logger.error("Failed to retrieve items from Alexa API.")
+        raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
+    # Find an *incomplete* item matching the name (single pass, no intermediate list)
+    item_to_mark = build_item_index(all_items, completed=False).get(needle)
 
     if not item_to_mark:
         logger.warning(f"Incomplete item '{item_name}' not found to mark complete.")
+        _remember_absent("incomplete", needle)
         raise HTTPException(status_code=404, detail=f"Incomplete item '{item_name}' not found.")
 
-    success = mark_item_as_completed(item_to_mark) # No longer needs config passed
+    success = await run_in_threadpool(mark_item_as_completed, item_to_mark) # No longer needs config passed
     if not success:
         logger.error(f"Failed to mark item '{item_name}' completed via Alexa API.")
         raise HTTPException(status_code=500, detail=f"Failed to mark item '{item_name}' as completed.")
@@ -221,21 +276,163 @@ async def mark_item_incomplete_endpoint(item_data: ItemNameModel):
     """Marks an item as incomplete by name (case-insensitive)."""
     item_name = item_data.item_name
     logger.info(f"Endpoint PUT /items/mark_incomplete called for: '{item_name}'")
-    all_items = get_shopping_list_items() # No longer needs config passed
-    # Find a *complete* item matching the name
-    completed_items = [item for item in (all_items or []) if item.get('completed', False)]
-    item_to_mark = find_item_by_name(completed_items, item_name)
+    needle = item_name.strip().lower()  # Normalize the requested name once
+    if _is_known_absent("completed", needle):
+        logger.debug(f"Completed item '{item_name}' known absent at current generation; skipping fetch.")
+        raise HTTPException(status_code=404, detail=f"Completed item '{item_name}' not found.")
+    all_items = await run_in_threadpool(get_shopping_list_items) # No longer needs config passed
+    if all_items is None:
+        logger.error("Failed to retrieve items from Alexa API.")
+        raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
+    # Find a *complete* item matching the name (single pass, no intermediate list)
+    item_to_mark = build_item_index(all_items, completed=True).get(needle)
 
     if not item_to_mark:
         logger.warning(f"Completed item '{item_name}' not found to mark incomplete.")
+        _remember_absent("completed", needle)
         raise HTTPException(status_code=404, detail=f"Completed item '{item_name}' not found.")
 
-    success = unmark_item_as_completed(item_to_mark)  # No longer needs config passed
+    success = await run_in_threadpool(unmark_item_as_completed, item_to_mark)  # No longer needs config passed
     if not success:
         logger.error(f"Failed to mark item '{item_name}' incomplete via Alexa API.")
         raise HTTPException(status_code=500, detail=f"Failed to mark item '{item_name}' as incomplete.")
     return {"message": f"Item '{item_name}' marked as incomplete."}
 
+# --- Bulk Endpoints ---
+# One request for N items: the list is fetched and indexed once, the
+# per-item Alexa calls fan out on the shared executor, and the caller gets
+# a per-item results array instead of paying one HTTP round trip per item.
+
+async def _bulk_lookup_operation(
+    item_names: List[str],
+    completed: Optional[bool],
+    operation,
+    success_verb: str,
+    failure_verb: str,
+    missing_label: str,
+) -> Dict[str, Any]:
+    """Resolves names against one fetched index, then applies 'operation' concurrently.
+
+    Results come back in input order. 'completed' restricts the lookup to
+    items in that completion state (as the per-item endpoints do);
+    'missing_label' prefixes the not-found message (e.g. "Incomplete item").
+    """
+    all_items = await run_in_threadpool(get_shopping_list_items)
+    if all_items is None:
+        logger.error("Failed to retrieve items from Alexa API.")
+        raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
+    index = build_item_index(all_items, completed=completed)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(item_names)
+    pending: List[Any] = []  # (position, name, item) for names that resolved
+    for pos, name in enumerate(item_names):
+        item = index.get(name.strip().lower())
+        if item is None:
+            results[pos] = {"item": name, "success": False,
+                            "message": f"{missing_label} '{name}' not found."}
+        else:
+            pending.append((pos, name, item))
+
+    if pending:
+        outcomes = await run_in_threadpool(
+            lambda: list(_EXECUTOR.map(operation, [item for _, _, item in pending])))
+        for (pos, name, _), ok in zip(pending, outcomes):
+            if ok:
+                results[pos] = {"item": name, "success": True,
+                                "message": f"Item '{name}' {success_verb}."}
+            else:
+                results[pos] = {"item": name, "success": False,
+                                "message": f"Failed to {failure_verb} item '{name}'."}
+    return {"results": results}
+
+@app.post("/items/bulk_add", tags=["Items"])
+async def bulk_add_items(item_data: ItemNamesModel):
+    """Adds multiple items to the shopping list in one request."""
+    logger.info(f"Endpoint POST /items/bulk_add called with {len(item_data.item_names)} names.")
+    names = item_data.item_names
+    outcomes = await run_in_threadpool(
+        lambda: list(_EXECUTOR.map(add_shopping_list_item, names)))
+    results = [{"item": name, "success": ok,
+                "message": f"Item '{name}' added successfully." if ok else f"Failed to add item '{name}'."}
+               for name, ok in zip(names, outcomes)]
+    return {"results": results}
+
+@app.post("/items/bulk_delete", tags=["Items"])
+async def bulk_delete_items(item_data: ItemNamesModel):
+    """Deletes multiple items from the shopping list by name (case-insensitive)."""
+    logger.info(f"Endpoint POST /items/bulk_delete called with {len(item_data.item_names)} names.")
+    return await _bulk_lookup_operation(
+        item_data.item_names, None, delete_shopping_list_item,
+        "deleted successfully", "delete", "Item")
+
+@app.post("/items/bulk_mark_completed", tags=["Items"])
+async def bulk_mark_items_completed(item_data: ItemNamesModel):
+    """Marks multiple items as completed by name (case-insensitive)."""
+    logger.info(f"Endpoint POST /items/bulk_mark_completed called with {len(item_data.item_names)} names.")
+    return await _bulk_lookup_operation(
+        item_data.item_names, False, mark_item_as_completed,
+        "marked as completed", "mark", "Incomplete item")
+
+@app.post("/items/bulk_mark_incomplete", tags=["Items"])
+async def bulk_mark_items_incomplete(item_data: ItemNamesModel):
+    """Marks multiple completed items as incomplete by name (case-insensitive)."""
+    logger.info(f"Endpoint POST /items/bulk_mark_incomplete called with {len(item_data.item_names)} names.")
+    return await _bulk_lookup_operation(
+        item_data.item_names, True, unmark_item_as_completed,
+        "marked as incomplete", "mark", "Completed item")
+
+@app.post("/items/clear_completed", tags=["Items"])
+async def clear_completed_list_items():
+    """Deletes all completed items from the shopping list.
+
+    Fetches the list once and issues all deletions concurrently. The
+    DELETE responses are treated as authoritative: a verification fetch
+    and single retry pass only happen if some deletion failed.
+    """
+    logger.info("Endpoint POST /items/clear_completed called.")
+    all_items = await run_in_threadpool(get_shopping_list_items, force_refresh=True)
+    if all_items is None:
+        logger.error("Failed to retrieve items from Alexa API.")
+        raise HTTPException(status_code=503, detail="Could not retrieve shopping list from Alexa.")
+
+    _, completed_items = partition_items(all_items)
+    todo = [item for item in completed_items if item.get('id')]
+    if not todo:
+        return {"message": "No completed items to clear.", "deleted": 0, "failed": 0}
+
+    results = await run_in_threadpool(
+        lambda: list(_EXECUTOR.map(delete_shopping_list_item, todo)))
+    deleted = sum(1 for ok in results if ok)
+
+    if deleted == len(todo):
+        # Every DELETE succeeded; no need to re-fetch just to confirm it.
+        return {"message": f"Cleared {deleted} completed items.", "deleted": deleted, "failed": 0}
+
+    # Some deletes failed: one verification fetch and a single retry pass
+    remaining = await run_in_threadpool(get_shopping_list_items, force_refresh=True)
+    if remaining is None:
+        # Can't verify, so report the unverified first-pass failures rather
+        # than claiming a clean clear off a failed fetch
+        failed = len(todo) - deleted
+        logger.error(f"Verification fetch failed; reporting {failed} unverified delete failures.")
+        return {"message": f"Cleared {deleted} completed items; {failed} could not be verified as deleted.",
+                "deleted": deleted, "failed": failed}
+    stragglers = [item for item in remaining if item.get('completed', False) and item.get('id')]
+    if stragglers:
+        logger.warning(f"{len(stragglers)} completed items remain after first pass; retrying once.")
+        retry_results = await run_in_threadpool(
+            lambda: list(_EXECUTOR.map(delete_shopping_list_item, stragglers)))
+        deleted += sum(1 for ok in retry_results if ok)
+        failed = sum(1 for ok in retry_results if not ok)
+    else:
+        failed = 0
+
+    if failed:
+        logger.error(f"Failed to delete {failed} completed items.")
+        return {"message": f"Cleared {deleted} completed items; {failed} could not be deleted.",
+                "deleted": deleted, "failed": failed}
+    return {"message": f"Cleared {deleted} completed items.", "deleted": deleted, "failed": 0}
+
 # --- Authentication Endpoint ---
 @app.post("/auth/cookies", tags=["Authentication"], status_code=200)
 async def receive_cookies(cookies_data: List[CookieModel]): # Expect a list of CookieModel
@@ -50,10 +50,14 @@ async def post_cookies_to_api(cookies_for_requests: List[Dict]):
 
 async def main():
     """Opens browser to sign-in page, waits for manual login, then extracts cookies."""
+    # force=True resets any handlers an imported library (e.g. nodriver) may
+    # have installed first, which would otherwise make this call a no-op and
+    # silently drop the configured level
     logging.basicConfig(
         level=auth_config.LOG_LEVEL_INT,
         format='%(asctime)s - %(name)s [%(levelname)s] %(message)s',
-        stream=sys.stdout
+        stream=sys.stdout,
+        force=True
     )
 
     logger.info("Starting Alexa authentication process with nodriver...")
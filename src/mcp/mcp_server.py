@@ -1,11 +1,12 @@
 #!/Users/sethrose/Developer/github/Temp/alexa-mcp/.venv/bin/python
 import sys
-import os
+import atexit
 import logging
-import requests  # For making API calls
+import time
+import asyncio
+import httpx  # For making API calls
 import json
 from typing import List, Dict, Any, Optional, Union
-from pathlib import Path
 
 # --- Path Modification ---
 # No longer needed as we read API_PORT directly from env
@@ -25,8 +26,24 @@ except ImportError as e:
 
 from fastmcp import FastMCP
 
-# Configure logging based on local config
-logging.basicConfig(level=mcp_config.LOG_LEVEL_INT, format='%(asctime)s - %(name)s [%(levelname)s] %(message)s')
+# orjson parses and serializes JSON several times faster than the stdlib;
+# fall back silently when it isn't installed (same pattern as the API layer)
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    _json_dumps = None
+
+# Logging is configured in the __main__ block so importing this module as a
+# library doesn't clobber the host application's logging setup
 logger = logging.getLogger(__name__)
 
 # --- Add File Handler ---
@@ -38,163 +55,275 @@ logger = logging.getLogger(__name__)
 # Use base URL directly from local config
 API_BASE_URL = mcp_config.API_BASE_URL
 
-logger.info(f"MCP Server configured to connect to API at: {mcp_config.API_BASE_URL}")
+logger.info("MCP Server configured to connect to API at: %s", mcp_config.API_BASE_URL)
 
 # Suppress noisy library logs based on loaded config
 if mcp_config.LOG_LEVEL_INT > logging.DEBUG:
-    logging.getLogger("requests").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
     logger.debug("Suppressed noisy library logs.")
 
 print("--- DEBUG: Initializing FastMCP server...", file=sys.stderr)
 
 # --- FastMCP Server Instance ---
-mcp = FastMCP("Alexa Shopping List")
+# Serialize tool results with orjson when it's available; get_all_items can
+# return long lists of dicts, where stdlib json.dumps is the bottleneck.
+# FastMCP 2.x accepts tool_serializer; 3.x removed it (raises TypeError)
+# without offering a global serializer hook, so on 3.x installs results go
+# through FastMCP's own serialization and only the inbound orjson parsing
+# applies.
+if _json_dumps is not None:
+    try:
+        mcp = FastMCP("Alexa Shopping List", tool_serializer=_json_dumps)
+    except TypeError:
+        logger.debug("Installed FastMCP does not accept tool_serializer; using its default serialization.")
+        mcp = FastMCP("Alexa Shopping List")
+else:
+    mcp = FastMCP("Alexa Shopping List")
 
 print("--- DEBUG: FastMCP server instance created.", file=sys.stderr)
 
 # --- Helper Functions ---
-def make_api_request(method: str, endpoint: str, json_data: Optional[Dict] = None) -> Dict:
-    """Makes a request to the FastAPI server and handles errors."""
-    url = f"{API_BASE_URL}{endpoint}"
-    logger.debug(f"Making {method} request to FastAPI: {url}")
 
+# Shared async client so every call to the local FastAPI server reuses a
+# pooled keep-alive connection instead of paying socket setup (and risking
+# TIME_WAIT port exhaustion) on each tool invocation. Tools are async, so
+# per-item calls overlap on the event loop via asyncio.gather with no
+# worker threads. The short connect timeout bounds a wedged server.
+_CLIENT = httpx.AsyncClient(
+    base_url=API_BASE_URL,
+    headers={"Accept": "application/json"},
+    timeout=httpx.Timeout(10.0, connect=1.0),
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+)
+
+def _close_client() -> None:
+    """Closes the shared client at interpreter exit (best effort)."""
     try:
-        if method.upper() == "GET":
-            response = requests.get(url)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=json_data)
-        elif method.upper() == "PUT":
-            response = requests.put(url, json=json_data)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, json=json_data)
-        else:
-            logger.error(f"Unsupported HTTP method: {method}")
-            return {"error": f"Unsupported HTTP method: {method}"}
+        asyncio.run(_CLIENT.aclose())
+    except RuntimeError:
+        pass  # An event loop is still running or already torn down
+
+atexit.register(_close_client)
+
+_ALLOWED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# Endpoint paths resolved once at import; the client's base_url supplies the
+# host, so no per-call URL concatenation happens (same idea as the API
+# layer's _URL_* constants)
+_EP_ROOT = "/"
+_EP_ITEMS = "/items"
+_EP_ITEMS_ALL = "/items/all"
+_EP_ITEMS_INCOMPLETE = "/items/incomplete"
+_EP_ITEMS_COMPLETED = "/items/completed"
+_EP_MARK_COMPLETED = "/items/mark_completed"
+_EP_MARK_INCOMPLETE = "/items/mark_incomplete"
+_EP_CLEAR_COMPLETED = "/items/clear_completed"
+_EP_BULK_ADD = "/items/bulk_add"
+_EP_BULK_DELETE = "/items/bulk_delete"
+_EP_BULK_MARK_COMPLETED = "/items/bulk_mark_completed"
+_EP_BULK_MARK_INCOMPLETE = "/items/bulk_mark_incomplete"
+
+def _normalize_item_names(item_name: Union[str, List[str]]) -> "tuple[List[str], List[Any]]":
+    """Splits tool input into (valid, invalid) names in a single pass.
+
+    Accepts a single string or a list of strings; valid names come back
+    stripped and deduplicated case-insensitively (first occurrence wins),
+    so inputs like ["milk", "Milk", "milk "] issue one request instead of
+    three racing on the same underlying item. All four mutating tools
+    share this, so input handling only needs changing in one place.
+    """
+    names = [item_name] if isinstance(item_name, str) else item_name
+    valid: List[str] = []
+    invalid: List[Any] = []
+    seen: set = set()
+    for name in names:
+        stripped = name.strip() if isinstance(name, str) else ""
+        if not stripped:
+            invalid.append(name)
+            continue
+        key = stripped.lower()
+        if key not in seen:
+            seen.add(key)
+            valid.append(stripped)
+    return valid, invalid
+
+def _extract_message(resp: Dict) -> str:
+    """Pulls the human-readable message out of an API response dict."""
+    message = resp.get("message")
+    return message if message is not None else resp.get("error", "Unknown result")
+
+def _as_list(resp, tool: str) -> list:
+    """Coerces a getter response to a list, logging anything unexpected."""
+    if isinstance(resp, list):
+        return resp
+    if "error" in resp:
+        logger.error("Error in %s: %s", tool, resp["error"])
+        return []
+    logger.warning("Unexpected response format in %s, expected list but got: %s", tool, type(resp))
+    return []
+
+# Short-lived memo for check_api_status: agents often probe status in
+# bursts, and the answer rarely changes within a couple of seconds. The
+# cache is dropped whenever a request hits a connection error so recovery
+# (or a freshly dead server) is noticed on the next status call.
+_STATUS_TTL = 2.0
+_STATUS_CACHE: Dict[str, Any] = {"ts": 0.0, "value": None}
+
+# Whether the API server exposes the /items/bulk_* endpoints. Detected on
+# first use (older servers 404 them) and cached for the process lifetime.
+_BULK_SUPPORTED: Optional[bool] = None
+
+async def _bulk_api_request(endpoint: str, names: List[str]) -> Optional[List[Dict]]:
+    """Sends all names to a bulk endpoint in one request.
+
+    Returns a list of response dicts aligned with 'names' (same shape the
+    per-item calls produce), or None when the server doesn't offer bulk
+    endpoints so the caller can fall back to per-item requests.
+    """
+    global _BULK_SUPPORTED
+    if not names:
+        return []
+    if _BULK_SUPPORTED is False:
+        return None
+
+    response = await make_api_request("POST", endpoint, {"item_names": names})
+    # FastAPI answers unknown routes with {"detail": "Not Found"}, which
+    # make_api_request surfaces as this exact error string
+    if response.get("error") == "Not Found":
+        _BULK_SUPPORTED = False
+        logger.warning("API server has no bulk endpoints; falling back to per-item requests.")
+        return None
+    if _BULK_SUPPORTED is None and "error" not in response:
+        # Only a successful bulk response proves support; transient errors
+        # (connection refused, 5xx) leave the flag undetermined so the next
+        # call probes again instead of latching the wrong answer
+        _BULK_SUPPORTED = True
 
-        # Raise exception for 4xx/5xx status codes
-        response.raise_for_status()
+    if "error" in response:
+        return [{"error": response["error"]} for _ in names]
+    results = response.get("results")
+    if not isinstance(results, list) or len(results) != len(names):
+        logger.warning("Unexpected bulk response shape from %s: %s", endpoint, type(results))
+        return [{"error": "Unexpected bulk response from API server."} for _ in names]
+    return [{"message": r.get("message", "")} if r.get("success")
+            else {"error": r.get("message", "Unknown result")}
+            for r in results]
+
+async def make_api_request(method: str, endpoint: str, json_data: Optional[Dict] = None) -> Dict:
+    """Makes a request to the FastAPI server and handles errors."""
+    logger.debug("Making %s request to FastAPI: %s", method, endpoint)
 
-        # Try to parse JSON, fall back to text if not JSON
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {"message": response.text}
+    method_upper = method.upper()
+    if method_upper not in _ALLOWED_METHODS:
+        logger.error("Unsupported HTTP method: %s", method)
+        return {"error": f"Unsupported HTTP method: {method}"}
 
-    except requests.exceptions.ConnectionError:
-        logger.error(f"Connection error: Could not connect to FastAPI server at {API_BASE_URL}")
+    try:
+        response = await _CLIENT.request(method_upper, endpoint, json=json_data)
+    except httpx.ConnectError:
+        logger.error("Connection error: Could not connect to FastAPI server at %s", API_BASE_URL)
+        _STATUS_CACHE["value"] = None  # Force the next status check to re-probe
         return {"error": "Could not connect to FastAPI server. Is it running?"}
-    except requests.exceptions.HTTPError as e:
-        logger.error(f"HTTP error: {e}")
-        # Try to get error details from the response
-        try:
-            error_detail = response.json().get("detail", str(e))
-        except (json.JSONDecodeError, AttributeError):
-            error_detail = str(e)
-        return {"error": error_detail}
     except Exception as e:
-        logger.error(f"Error making API request: {e}")
+        logger.error("Error making API request: %s", e)
         return {"error": str(e)}
 
+    # Parse the body exactly once from the raw bytes; both the error and
+    # success paths below reuse the result. FastAPI labels its bodies
+    # reliably, so a Content-Type peek replaces the try/except around the
+    # parse and non-JSON responses never pay a raised exception
+    if response.headers.get("Content-Type", "").startswith("application/json"):
+        payload = _json_loads(response.content)
+    else:
+        payload = None
+
+    if response.status_code >= 400:
+        if isinstance(payload, dict) and "detail" in payload:
+            error_detail = payload["detail"]
+        else:
+            error_detail = response.text or f"HTTP {response.status_code}"
+        logger.error("HTTP error %s from %s: %s", response.status_code, endpoint, error_detail)
+        return {"error": error_detail}
+
+    if payload is not None:
+        return payload
+    return {"message": response.text}
+
 # --- Tool Definitions ---
 # These now proxy requests to our FastAPI server
 
 @mcp.tool()
-def get_all_items() -> list[dict]:
+async def get_all_items() -> list[dict]:
     """
     Retrieves all items currently on the Alexa shopping list, including both active (incomplete) and completed items.
     Returns a list of dictionaries, where each dictionary represents an item and includes keys like 'id', 'value', and 'completed'.
     An empty list is returned if the shopping list is empty or an error occurs.
     """
-    logger.info("Tool 'get_all_items' called.")
-    response = make_api_request("GET", "/items/all")
-
-    if "error" in response:
-        logger.error(f"Error in get_all_items: {response['error']}")
-        return []  # Return empty list on error
-
-    # Make sure we return a list even if API somehow returns something else
-    if isinstance(response, list):
-        return response  # API already returns the list format we need
-    else:
-        logger.warning(f"Unexpected response format from API, expected list but got: {type(response)}")
-        return []
+    logger.debug("Tool 'get_all_items' called.")
+    response = await make_api_request("GET", _EP_ITEMS_ALL)
+    return _as_list(response, "get_all_items")
 
 @mcp.tool()
-def get_incomplete_items() -> list[dict]:
+async def get_incomplete_items() -> list[dict]:
     """
     Retrieves only the active (incomplete) items currently on the Alexa shopping list.
     This is useful for seeing what still needs to be purchased.
     Returns a list of dictionaries, each representing an item with keys like 'id', 'value', and 'completed' (which will be false).
     An empty list is returned if there are no active items or an error occurs.
     """
-    logger.info("Tool 'get_incomplete_items' called.")
-    response = make_api_request("GET", "/items/incomplete")
-
-    if "error" in response:
-        logger.error(f"Error in get_incomplete_items: {response['error']}")
-        return []
-
-    # Make sure we return a list even if API somehow returns something else
-    if isinstance(response, list):
-        return response
-    else:
-        logger.warning(f"Unexpected response format from API, expected list but got: {type(response)}")
-        return []
+    logger.debug("Tool 'get_incomplete_items' called.")
+    response = await make_api_request("GET", _EP_ITEMS_INCOMPLETE)
+    return _as_list(response, "get_incomplete_items")
 
 @mcp.tool()
-def get_completed_items() -> list[dict]:
+async def get_completed_items() -> list[dict]:
     """
     Retrieves only the completed items currently on the Alexa shopping list.
     This shows items that have been marked as done.
     Returns a list of dictionaries, each representing an item with keys like 'id', 'value', and 'completed' (which will be true).
     An empty list is returned if there are no completed items or an error occurs.
     """
-    logger.info("Tool 'get_completed_items' called.")
-    response = make_api_request("GET", "/items/completed")
-
-    if "error" in response:
-        logger.error(f"Error in get_completed_items: {response['error']}")
-        return []
-
-    # Make sure we return a list even if API somehow returns something else
-    if isinstance(response, list):
-        return response
-    else:
-        logger.warning(f"Unexpected response format from API, expected list but got: {type(response)}")
-        return []
+    logger.debug("Tool 'get_completed_items' called.")
+    response = await make_api_request("GET", _EP_ITEMS_COMPLETED)
+    return _as_list(response, "get_completed_items")
 
 @mcp.tool()
-def add_item(item_name: Union[str, List[str]]) -> dict:
+async def add_item(item_name: Union[str, List[str]]) -> dict:
     """
     Adds one or more new items to the Alexa shopping list.
     Input can be a single item name as a string (e.g., "Milk") or a list of item names as strings (e.g., ["Eggs", "Bread"]).
     Returns a dictionary indicating the overall success or failure and a summary message.
     If adding multiple items, it attempts to add each one; the overall result is success only if all additions succeed.
     """
-    logger.info(f"Tool 'add_item' called with item_name(s): '{item_name}'")
-
-    item_names = [item_name] if isinstance(item_name, str) else item_name
-    results = []
-    all_succeeded = True
-
-    for name in item_names:
-        if not isinstance(name, str) or not name.strip():
-             logger.warning(f"Skipping invalid item name: {name}")
-             results.append({"item": name, "success": False, "message": "Invalid item name provided."})
-             all_succeeded = False
-             continue
-
-        response = make_api_request("POST", "/items", {"item_name": name.strip()})
+    logger.debug("Tool 'add_item' called with item_name(s): %r", item_name)
+
+    valid_names, invalid_names = _normalize_item_names(item_name)
+    if invalid_names:
+        logger.warning("Skipping invalid item name: %s", invalid_names)
+    results = [{"item": name, "success": False, "message": "Invalid item name provided."}
+               for name in invalid_names]
+    all_succeeded = not invalid_names
+    add_result = results.append
+    failures: List[str] = []  # Collected for one summary log instead of one line per item
+
+    responses = await _bulk_api_request(_EP_BULK_ADD, valid_names)
+    if responses is None:
+        responses = await asyncio.gather(
+            *(make_api_request("POST", _EP_ITEMS, {"item_name": n}) for n in valid_names))
+    for name, response in zip(valid_names, responses):
         success = "error" not in response
-        message = response.get("message", response.get("error", "Unknown result"))
-        results.append({"item": name.strip(), "success": success, "message": message})
+        message = _extract_message(response)
+        add_result({"item": name, "success": success, "message": message})
         if not success:
             all_succeeded = False
-            logger.error(f"Error adding item '{name.strip()}': {message}")
+            failures.append(f"{name}: {message}")
+
+    if failures:
+        logger.error("add_item: %d/%d items failed: %s", len(failures), len(results), failures)
 
     # Construct summary message
-    if len(item_names) == 1:
+    if len(valid_names) + len(invalid_names) == 1:
         summary_message = results[0]['message']
     else:
         success_count = sum(1 for r in results if r['success'])
@@ -209,7 +338,7 @@ def add_item(item_name: Union[str, List[str]]) -> dict:
     return {"success": all_succeeded, "message": summary_message, "details": results}
 
 @mcp.tool()
-def delete_item(item_name: Union[str, List[str]]) -> dict:
+async def delete_item(item_name: Union[str, List[str]]) -> dict:
     """
     Deletes one or more items from the Alexa shopping list by their exact name (case-insensitive).
     Input can be a single item name as a string (e.g., "Milk") or a list of item names as strings (e.g., ["Old Bread", "Expired Yogurt"]).
@@ -217,29 +346,34 @@ def delete_item(item_name: Union[str, List[str]]) -> dict:
     Returns a dictionary indicating the overall success or failure and a summary message.
     If deleting multiple items, it attempts each one; the overall result is success only if all deletions succeed.
     """
-    logger.info(f"Tool 'delete_item' called with item_name(s): '{item_name}'")
-
-    item_names = [item_name] if isinstance(item_name, str) else item_name
-    results = []
-    all_succeeded = True
-
-    for name in item_names:
-        if not isinstance(name, str) or not name.strip():
-             logger.warning(f"Skipping invalid item name for deletion: {name}")
-             results.append({"item": name, "success": False, "message": "Invalid item name provided."})
-             all_succeeded = False
-             continue
-
-        response = make_api_request("DELETE", "/items", {"item_name": name.strip()})
+    logger.debug("Tool 'delete_item' called with item_name(s): %r", item_name)
+
+    valid_names, invalid_names = _normalize_item_names(item_name)
+    if invalid_names:
+        logger.warning("Skipping invalid item name for deletion: %s", invalid_names)
+    results = [{"item": name, "success": False, "message": "Invalid item name provided."}
+               for name in invalid_names]
+    all_succeeded = not invalid_names
+    add_result = results.append
+    failures: List[str] = []  # Collected for one summary log instead of one line per item
+
+    responses = await _bulk_api_request(_EP_BULK_DELETE, valid_names)
+    if responses is None:
+        responses = await asyncio.gather(
+            *(make_api_request("DELETE", _EP_ITEMS, {"item_name": n}) for n in valid_names))
+    for name, response in zip(valid_names, responses):
         success = "error" not in response
-        message = response.get("message", response.get("error", "Unknown result"))
-        results.append({"item": name.strip(), "success": success, "message": message})
+        message = _extract_message(response)
+        add_result({"item": name, "success": success, "message": message})
         if not success:
             all_succeeded = False
-            logger.error(f"Error deleting item '{name.strip()}': {message}")
+            failures.append(f"{name}: {message}")
+
+    if failures:
+        logger.error("delete_item: %d/%d items failed: %s", len(failures), len(results), failures)
 
     # Construct summary message
-    if len(item_names) == 1:
+    if len(valid_names) + len(invalid_names) == 1:
         summary_message = results[0]['message']
     else:
         success_count = sum(1 for r in results if r['success'])
@@ -254,7 +388,7 @@ def delete_item(item_name: Union[str, List[str]]) -> dict:
     return {"success": all_succeeded, "message": summary_message, "details": results}
 
 @mcp.tool()
-def mark_item_completed(item_name: Union[str, List[str]]) -> dict:
+async def mark_item_completed(item_name: Union[str, List[str]]) -> dict:
     """
     Marks one or more items on the Alexa shopping list as completed by their exact name (case-insensitive).
     Input can be a single item name as a string (e.g., "Milk") or a list of item names as strings (e.g., ["Eggs", "Bread"]).
@@ -262,29 +396,34 @@ def mark_item_completed(item_name: Union[str, List[str]]) -> dict:
     Returns a dictionary indicating the overall success or failure and a summary message.
     If marking multiple items, it attempts each one; the overall result is success only if all attempts succeed.
     """
-    logger.info(f"Tool 'mark_item_completed' called with item_name(s): '{item_name}'")
-
-    item_names = [item_name] if isinstance(item_name, str) else item_name
-    results = []
-    all_succeeded = True
-
-    for name in item_names:
-        if not isinstance(name, str) or not name.strip():
-             logger.warning(f"Skipping invalid item name for completion: {name}")
-             results.append({"item": name, "success": False, "message": "Invalid item name provided."})
-             all_succeeded = False
-             continue
-
-        response = make_api_request("PUT", "/items/mark_completed", {"item_name": name.strip()})
+    logger.debug("Tool 'mark_item_completed' called with item_name(s): %r", item_name)
+
+    valid_names, invalid_names = _normalize_item_names(item_name)
+    if invalid_names:
+        logger.warning("Skipping invalid item name for completion: %s", invalid_names)
+    results = [{"item": name, "success": False, "message": "Invalid item name provided."}
+               for name in invalid_names]
+    all_succeeded = not invalid_names
+    add_result = results.append
+    failures: List[str] = []  # Collected for one summary log instead of one line per item
+
+    responses = await _bulk_api_request(_EP_BULK_MARK_COMPLETED, valid_names)
+    if responses is None:
+        responses = await asyncio.gather(
+            *(make_api_request("PUT", _EP_MARK_COMPLETED, {"item_name": n}) for n in valid_names))
+    for name, response in zip(valid_names, responses):
         success = "error" not in response
-        message = response.get("message", response.get("error", "Unknown result"))
-        results.append({"item": name.strip(), "success": success, "message": message})
+        message = _extract_message(response)
+        add_result({"item": name, "success": success, "message": message})
         if not success:
             all_succeeded = False
-            logger.error(f"Error marking item '{name.strip()}' completed: {message}")
+            failures.append(f"{name}: {message}")
+
+    if failures:
+        logger.error("mark_item_completed: %d/%d items failed: %s", len(failures), len(results), failures)
 
     # Construct summary message
-    if len(item_names) == 1:
+    if len(valid_names) + len(invalid_names) == 1:
         summary_message = results[0]['message']
     else:
         success_count = sum(1 for r in results if r['success'])
@@ -299,7 +438,7 @@ def mark_item_completed(item_name: Union[str, List[str]]) -> dict:
     return {"success": all_succeeded, "message": summary_message, "details": results}
 
 @mcp.tool()
-def mark_item_incomplete(item_name: Union[str, List[str]]) -> dict:
+async def mark_item_incomplete(item_name: Union[str, List[str]]) -> dict:
     """
     Marks one or more previously completed items on the Alexa shopping list as incomplete (active) by their exact name (case-insensitive).
     Input can be a single item name as a string (e.g., "Milk") or a list of item names as strings (e.g., ["Eggs", "Bread"]).
@@ -308,29 +447,34 @@ def mark_item_incomplete(item_name: Union[str, List[str]]) -> dict:
     Returns a dictionary indicating the overall success or failure and a summary message.
     If marking multiple items, it attempts each one; the overall result is success only if all attempts succeed.
     """
-    logger.info(f"Tool 'mark_item_incomplete' called with item_name(s): '{item_name}'")
-
-    item_names = [item_name] if isinstance(item_name, str) else item_name
-    results = []
-    all_succeeded = True
-
-    for name in item_names:
-        if not isinstance(name, str) or not name.strip():
-             logger.warning(f"Skipping invalid item name for marking incomplete: {name}")
-             results.append({"item": name, "success": False, "message": "Invalid item name provided."})
-             all_succeeded = False
-             continue
-
-        response = make_api_request("PUT", "/items/mark_incomplete", {"item_name": name.strip()})
+    logger.debug("Tool 'mark_item_incomplete' called with item_name(s): %r", item_name)
+
+    valid_names, invalid_names = _normalize_item_names(item_name)
+    if invalid_names:
+        logger.warning("Skipping invalid item name for marking incomplete: %s", invalid_names)
+    results = [{"item": name, "success": False, "message": "Invalid item name provided."}
+               for name in invalid_names]
+    all_succeeded = not invalid_names
+    add_result = results.append
+    failures: List[str] = []  # Collected for one summary log instead of one line per item
+
+    responses = await _bulk_api_request(_EP_BULK_MARK_INCOMPLETE, valid_names)
+    if responses is None:
+        responses = await asyncio.gather(
+            *(make_api_request("PUT", _EP_MARK_INCOMPLETE, {"item_name": n}) for n in valid_names))
+    for name, response in zip(valid_names, responses):
         success = "error" not in response
-        message = response.get("message", response.get("error", "Unknown result"))
-        results.append({"item": name.strip(), "success": success, "message": message})
+        message = _extract_message(response)
+        add_result({"item": name, "success": success, "message": message})
         if not success:
             all_succeeded = False
-            logger.error(f"Error marking item '{name.strip()}' incomplete: {message}")
+            failures.append(f"{name}: {message}")
+
+    if failures:
+        logger.error("mark_item_incomplete: %d/%d items failed: %s", len(failures), len(results), failures)
 
      # Construct summary message
-    if len(item_names) == 1:
+    if len(valid_names) + len(invalid_names) == 1:
         summary_message = results[0]['message']
     else:
         success_count = sum(1 for r in results if r['success'])
@@ -344,33 +488,64 @@ def mark_item_incomplete(item_name: Union[str, List[str]]) -> dict:
 
     return {"success": all_succeeded, "message": summary_message, "details": results}
 
+@mcp.tool()
+async def clear_completed_items() -> dict:
+    """
+    Deletes all completed items from the Alexa shopping list in a single operation.
+    This is more efficient than calling delete_item for each completed item individually.
+    Returns a dictionary indicating success or failure, a summary message, and the number of items deleted.
+    """
+    logger.debug("Tool 'clear_completed_items' called.")
+    response = await make_api_request("POST", _EP_CLEAR_COMPLETED)
+
+    if "error" in response:
+        logger.error("Error in clear_completed_items: %s", response['error'])
+        return {"success": False, "message": response["error"]}
+
+    return {
+        "success": response.get("failed", 0) == 0,
+        "message": response.get("message", "Completed items cleared."),
+        "deleted": response.get("deleted", 0),
+        "failed": response.get("failed", 0)
+    }
+
 # --- API Status Check ---
 @mcp.tool()
-def check_api_status() -> dict:
+async def check_api_status() -> dict:
     """
     Checks if the backend FastAPI server (responsible for communicating with the actual Alexa API) is running and accessible.
     This is useful for diagnosing connection issues between the MCP server and the FastAPI server.
     Returns a dictionary with 'status' ('OK' or 'ERROR') and a descriptive 'message'.
     """
-    logger.info("Tool 'check_api_status' called.")
-    response = make_api_request("GET", "/")
+    logger.debug("Tool 'check_api_status' called.")
+    if _STATUS_CACHE["value"] is not None and time.monotonic() - _STATUS_CACHE["ts"] < _STATUS_TTL:
+        logger.debug("Returning cached API status.")
+        return _STATUS_CACHE["value"]
+
+    response = await make_api_request("GET", _EP_ROOT)
 
     if "error" in response:
-        logger.error(f"API status check failed: {response['error']}")
-        return {
+        logger.error("API status check failed: %s", response['error'])
+        result = {
             "status": "ERROR",
             "message": f"FastAPI server is not accessible: {response['error']}"
         }
+    else:
+        result = {
+            "status": "OK",
+            "message": "FastAPI server is running and accessible.",
+            "details": response
+        }
 
-    return {
-        "status": "OK",
-        "message": "FastAPI server is running and accessible.",
-        "details": response
-    }
+    _STATUS_CACHE["ts"] = time.monotonic()
+    _STATUS_CACHE["value"] = result
+    return result
 
 # --- Run Server ---
 if __name__ == "__main__":
     print("--- DEBUG: Entering __main__ block.", file=sys.stderr)
+    # Configure logging based on local config
+    logging.basicConfig(level=mcp_config.LOG_LEVEL_INT, format='%(asctime)s - %(name)s [%(levelname)s] %(message)s')
     logger.info("Starting FastMCP server...")
     print("--- MCP Server: Starting ---", file=sys.stderr); sys.stderr.flush()
 
@@ -387,8 +562,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"--- MCP Server FATAL ERROR: Exception from mcp.run(): {e} ---", file=sys.stderr)
         logger.exception(f"Exception from mcp.run(): {e}")  # Log with traceback via logger
-        import traceback
-        traceback.print_exc(file=sys.stderr)  # Also print traceback directly
         sys.stderr.flush()
         sys.exit(1)  # Ensure exit on error from run
     finally: